@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 import keyring
 from keyring.errors import KeyringError, NoKeyringError
 
@@ -11,16 +13,22 @@ LOGGER = get_logging_manager().logger
 SERVICE_NAME = "OpenFortiVPN-Manager"
 
 
+@functools.lru_cache(maxsize=1)
+def keyring_available() -> bool:
+    """Probe the keyring backend once per process; it cannot change at runtime."""
+    try:
+        keyring.get_keyring()
+    except Exception as exc:
+        LOGGER.warning("Keyring backend unavailable: %s", exc)
+        return False
+    return True
+
+
 class KeyringManager:
     """High-level wrapper providing error tolerant keyring operations."""
 
     def __init__(self) -> None:
-        self._available = True
-        try:
-            keyring.get_keyring()
-        except Exception as exc:
-            LOGGER.warning("Keyring backend unavailable: %s", exc)
-            self._available = False
+        self._available = keyring_available()
 
     def is_available(self) -> bool:
         return self._available
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import stat
 import threading
 from pathlib import Path
 from typing import Dict, List
@@ -11,6 +13,11 @@ import yaml
 from core.app_paths import CONFIG_FILE, ensure_directories
 from core.vpn_profile import VPNProfile
 
+# Prefer the libyaml-backed safe loader/dumper; PyYAML builds without libyaml
+# fall back to the pure-Python implementations with identical output.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class ConfigManager:
     """Load and save VPN profiles from the configuration file."""
@@ -27,8 +34,9 @@ class ConfigManager:
         if not Path(CONFIG_FILE).exists():
             self._profiles = {}
             return
-        with open(CONFIG_FILE, "r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle) or {}
+        # libyaml detects the encoding itself, so skip the text-layer decode.
+        with open(CONFIG_FILE, "rb") as handle:
+            data = yaml.load(handle, Loader=_YamlLoader) or {}
         profiles = {}
         for entry in data.get("profiles", []):
             profile = VPNProfile.from_dict(entry)
@@ -40,8 +48,23 @@ class ConfigManager:
             data = {
                 "profiles": [profile.to_dict() for profile in self._profiles.values()],
             }
-            with open(CONFIG_FILE, "w", encoding="utf-8") as handle:
-                yaml.safe_dump(data, handle, sort_keys=False)
+            # Write beside the live file and swap it in with one rename, so an
+            # interrupted save never leaves a truncated profile list behind.
+            staging = Path(CONFIG_FILE).with_name(Path(CONFIG_FILE).name + ".tmp")
+            try:
+                mode = stat.S_IMODE(os.stat(CONFIG_FILE).st_mode)
+            except FileNotFoundError:
+                mode = 0o600
+            try:
+                with open(staging, "wb") as handle:
+                    os.fchmod(handle.fileno(), mode)
+                    yaml.dump(data, handle, Dumper=_YamlDumper, sort_keys=False, encoding="utf-8")
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                os.replace(staging, CONFIG_FILE)
+            finally:
+                # Only left behind when the dump or the rename failed.
+                staging.unlink(missing_ok=True)
 
     def profiles(self) -> List[VPNProfile]:
         with self._lock:
@@ -6,7 +6,7 @@ import configparser
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from shutil import which
 
@@ -24,21 +24,25 @@ BROWSER_CANDIDATES = {
         "executables": ["firefox"],
         "profile_dir": Path.home() / ".mozilla" / "firefox",
         "profile_parser": "ini",
+        "profile_args": ("-P", "{profile}"),
     },
     "chromium": {
         "executables": ["chromium", "chromium-browser"],
         "profile_dir": Path.home() / ".config" / "chromium",
         "profile_parser": "directories",
+        "profile_args": ("--profile-directory={profile}",),
     },
     "chrome": {
         "executables": ["google-chrome", "google-chrome-stable"],
         "profile_dir": Path.home() / ".config" / "google-chrome",
         "profile_parser": "directories",
+        "profile_args": ("--profile-directory={profile}",),
     },
     "edge": {
         "executables": ["microsoft-edge"],
         "profile_dir": Path.home() / ".config" / "microsoft-edge",
         "profile_parser": "directories",
+        "profile_args": ("--profile-directory={profile}",),
     },
 }
 
@@ -66,6 +70,16 @@ def _list_directories(path: Path) -> List[str]:
     return entries
 
 
+# Chromium-style profile selection is the fallback for unlisted browsers.
+_DEFAULT_PROFILE_ARGS: Tuple[str, ...] = ("--profile-directory={profile}",)
+PROFILE_ARGS = {key: meta["profile_args"] for key, meta in BROWSER_CANDIDATES.items()}
+
+
+def profile_arguments(key: str, profile: str) -> List[str]:
+    """Return the command-line arguments that open ``profile`` in browser ``key``."""
+    return [arg.format(profile=profile) for arg in PROFILE_ARGS.get(key, _DEFAULT_PROFILE_ARGS)]
+
+
 PROFILE_PARSERS = {
     "ini": _parse_firefox_profiles,
     "directories": _list_directories,
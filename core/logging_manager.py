@@ -4,16 +4,37 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
 from collections import deque
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Callable, Deque, List
+from typing import Callable, Deque, List, Optional, Tuple
 
 from .app_paths import LOG_DIR
 
 LOG_HISTORY_SIZE = 2000
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the strftime part of a timestamp once per second."""
+
+    def __init__(self, fmt: str) -> None:
+        super().__init__(fmt)
+        self._time_cache: Tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        # Read and replace the cache as one tuple so handlers formatting on
+        # different threads never pair a second with another second's text.
+        cached_second, text = self._time_cache
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
 class _InMemoryHandler(logging.Handler):
     """Logging handler that keeps an in-memory deque and notifies listeners."""
 
@@ -52,7 +73,7 @@ class LoggingManager:
         for handler in list(self.logger.handlers):
             self.logger.removeHandler(handler)
         file_handler = RotatingFileHandler(Path(LOG_DIR) / "application.log", maxBytes=2 * 1024 * 1024, backupCount=3)
-        formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+        formatter = _CachedTimeFormatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
         file_handler.setFormatter(formatter)
         file_handler.setLevel(logging.DEBUG)
         memory_handler = _InMemoryHandler(self._history, self._listeners, self._lock)
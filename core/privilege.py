@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import shutil
 import signal
 import subprocess
@@ -11,6 +12,12 @@ PasswordResponse = Tuple[str, bool]
 PasswordProvider = Callable[[], Optional[PasswordResponse]]
 
 
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """Resolve ``name`` on PATH once per process."""
+    return shutil.which(name)
+
+
 class PrivilegeManager:
     """Encapsulates the logic required to run commands with elevated rights."""
 
@@ -18,8 +25,8 @@ class PrivilegeManager:
         self._password_provider = password_provider
         self._cached_password: Optional[str] = None
         self._cache_allowed = False
-        self._pkexec_path = shutil.which("pkexec")
-        self._sudo_path = shutil.which("sudo")
+        self._pkexec_path = _which("pkexec")
+        self._sudo_path = _which("sudo")
 
     def clear_cached_password(self) -> None:
         self._cached_password = None
@@ -83,13 +90,12 @@ class PrivilegeManager:
             stderr=subprocess.PIPE,
             text=True,
         )
-        if password and process.stdin:
-            process.stdin.write(password + "\n")
-        if input_text and process.stdin:
-            process.stdin.write(input_text)
-        if (password or input_text) and process.stdin:
-            process.stdin.flush()
-        stdout, stderr = process.communicate()
+        # communicate() feeds stdin while draining the output pipes, so a
+        # large input_text can never block on a full stdout buffer.
+        payload = f"{password}\n" if password else ""
+        if input_text:
+            payload += input_text
+        stdout, stderr = process.communicate(payload or None)
         if password and not self._cache_allowed:
             self._cached_password = None
         return process.returncode, stdout, stderr
@@ -25,6 +25,8 @@ Signal = QtCore.pyqtSignal
 Slot = QtCore.pyqtSlot
 QObject = QtCore.QObject
 QThread = QtCore.QThread
+QTimer = QtCore.QTimer
+QTextCursor = QtGui.QTextCursor
 
 QApplication = QtWidgets.QApplication
 QMainWindow = QtWidgets.QMainWindow
@@ -59,6 +61,10 @@ if QT_VERSION == 5:  # pragma: no cover - only exercised on PyQt5 systems
             Horizontal=Qt.Horizontal,
             Vertical=Qt.Vertical,
         )
+    if not hasattr(getattr(Qt, "ItemDataRole", None), "DisplayRole"):
+        Qt.ItemDataRole = SimpleNamespace(  # type: ignore[attr-defined]
+            DisplayRole=Qt.DisplayRole,
+        )
     if not hasattr(Qt, "ToolBarArea"):
         Qt.ToolBarArea = SimpleNamespace(  # type: ignore[attr-defined]
             TopToolBarArea=Qt.TopToolBarArea,
@@ -113,6 +119,11 @@ if QT_VERSION == 5:  # pragma: no cover - only exercised on PyQt5 systems
             Minimum=QSizePolicy.Minimum,
         )
 
+    if not hasattr(getattr(QTextCursor, "MoveOperation", None), "End"):
+        QTextCursor.MoveOperation = SimpleNamespace(  # type: ignore[attr-defined]
+            End=QTextCursor.End,
+        )
+
 __all__ = [
     "QT_VERSION",
     "Qt",
@@ -120,6 +131,8 @@ __all__ = [
     "Slot",
     "QObject",
     "QThread",
+    "QTimer",
+    "QTextCursor",
     "QApplication",
     "QMainWindow",
     "QMessageBox",
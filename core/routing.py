@@ -7,6 +7,7 @@ import socket
 import subprocess
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
@@ -18,6 +19,27 @@ from .privilege import PrivilegeManager
 LOGGER = get_logging_manager().logger
 
 
+# Host name lookups are reused for this many seconds by the same session on
+# the same tunnel interface, including across reconnects.
+_RESOLVE_TTL = 300.0
+
+
+def _lookup_host(host: str) -> Tuple[str, ...]:
+    """Return the distinct addresses ``getaddrinfo`` reports for ``host``."""
+    return tuple(dict.fromkeys(entry[4][0] for entry in socket.getaddrinfo(host, None)))
+
+
+def _ip_family(value: str) -> Optional[int]:
+    """Return 4 or 6 when ``value`` is a literal IP address, otherwise None."""
+    for family, version in ((socket.AF_INET, 4), (socket.AF_INET6, 6)):
+        try:
+            socket.inet_pton(family, value)
+        except OSError:
+            continue
+        return version
+    return None
+
+
 @dataclass
 class AppliedRoute:
     destination: str
@@ -36,33 +58,55 @@ class RouteManager:
         self._session_routes: Dict[str, List[AppliedRoute]] = {}
         self._gateway_hints: Dict[str, Dict[str, Dict[str, str]]] = {}
         self._session_gateway_targets: Dict[str, set[str]] = {}
+        # Route target lookups keyed by (session, tunnel interface, host): a
+        # split-DNS answer is only valid for the tunnel that produced it.
+        self._resolved: Dict[Tuple[str, str, str], Tuple[float, Tuple[str, ...]]] = {}
+        self._resolved_lock = threading.Lock()
         self._lock = threading.RLock()
 
     def _run_privileged(self, command: List[str]) -> Tuple[int, str, str]:
         return self._privilege_manager.run_privileged(command, prefer_sudo=True)
 
-    def _resolve_targets(self, target: str) -> List[Tuple[str, int]]:
+    def _resolve_host(self, session_id: str, interface: str, host: str) -> Tuple[str, ...]:
+        """Resolve ``host`` through the session's tunnel, reusing a recent lookup."""
+        key = (session_id, interface, host)
+        now = time.monotonic()
+        with self._resolved_lock:
+            cached = self._resolved.get(key)
+        if cached and now - cached[0] < _RESOLVE_TTL:
+            return cached[1]
+        addresses = _lookup_host(host)
+        with self._resolved_lock:
+            self._resolved[key] = (now, addresses)
+        return addresses
+
+    def _prefetch_hosts(self, session_id: str, interface: str, hosts: List[str]) -> None:
+        """Warm the lookup cache for several host names concurrently."""
+
+        def prefetch(host: str) -> None:
+            try:
+                self._resolve_host(session_id, interface, host)
+            except OSError:
+                # The apply loop resolves again and reports the failure there.
+                pass
+
+        with ThreadPoolExecutor(max_workers=min(len(hosts), 8)) as pool:
+            list(pool.map(prefetch, hosts))
+
+    def _resolve_targets(self, session_id: str, interface: str, target: str) -> List[Tuple[str, int]]:
         """Expand a user-specified target into concrete destinations."""
         destinations: List[Tuple[str, int]] = []
-        try:
-            network = ipaddress.ip_network(target, strict=False)
-            destinations.append((str(network), network.version))
-            return destinations
-        except ValueError:
+        # Screen with inet_pton so host names skip the ipaddress parsers.
+        if _ip_family(target.partition("/")[0]):
             try:
-                address = ipaddress.ip_address(target)
-                destinations.append((str(address), address.version))
+                network = ipaddress.ip_network(target, strict=False)
+                destinations.append((str(network), network.version))
                 return destinations
             except ValueError:
-                info = socket.getaddrinfo(target, None)
-                seen: set[str] = set()
-                for entry in info:
-                    addr = entry[4][0]
-                    if addr in seen:
-                        continue
-                    seen.add(addr)
-                    family = 6 if ":" in addr else 4
-                    destinations.append((addr, family))
+                pass
+        for addr in self._resolve_host(session_id, interface, target):
+            family = 6 if ":" in addr else 4
+            destinations.append((addr, family))
         return destinations
 
     def _detect_interface(self, previous: List[str]) -> Optional[str]:
@@ -95,9 +139,7 @@ class RouteManager:
             network = ipaddress.ip_network(destination, strict=False)
             return network.prefixlen
         except ValueError:
-            try:
-                address = ipaddress.ip_address(destination)
-            except ValueError:
+            if _ip_family(destination) is None:
                 return None
             return 32 if family == 4 else 128
 
@@ -186,18 +228,14 @@ class RouteManager:
         if not host:
             return
         try:
-            info = socket.getaddrinfo(host, None)
+            # Resolved before the tunnel exists, so never cached for routes.
+            addresses = _lookup_host(host)
         except socket.gaierror as exc:
             LOGGER.debug("[%s] Unable to resolve %s for gateway hint: %s", session_id, host, exc)
             return
         with self._lock:
             hints = self._gateway_hints.setdefault(session_id, {})
-            seen: set[str] = set()
-            for entry in info:
-                address = entry[4][0]
-                if address in seen:
-                    continue
-                seen.add(address)
+            for address in addresses:
                 family = 6 if ":" in address else 4
                 normalized = self._normalize_destination(address, family)
                 route = self._query_route(address, family)
@@ -356,13 +394,18 @@ class RouteManager:
                 )
                 return
         time.sleep(1)
+        # Lookups wait on the network, so overlap them before the sequential
+        # apply loop below picks the answers up from the cache.
+        hosts = [entry for entry in targets if not _ip_family(entry.partition("/")[0])]
+        if len(hosts) > 1:
+            self._prefetch_hosts(session_id, interface, hosts)
         with self._lock:
             applied: List[AppliedRoute] = []
             # Clear out any stale state from previous connection attempts.
             self._session_routes.pop(session_id, None)
             for entry in targets:
                 try:
-                    destinations = self._resolve_targets(entry)
+                    destinations = self._resolve_targets(session_id, interface, entry)
                 except Exception as exc:
                     LOGGER.error("Failed to resolve route target %s: %s", entry, exc)
                     continue
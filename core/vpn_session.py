@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+import fcntl
+import functools
 import os
 import re
+import select
+import selectors
 import signal
 import subprocess
+import sys
 import threading
 import time
 import webbrowser
-from typing import Dict, Iterable, List, Optional, Tuple
-
-import psutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 from core.qt_compat import QThread, Signal
 
-from .browser_detection import BrowserInfo, detect_browsers
+from .browser_detection import BrowserInfo, detect_browsers, profile_arguments
+from .command_builder import build_openfortivpn_command
 from .logging_manager import get_logging_manager
 from .privilege import PrivilegeManager
 from .routing import RouteManager
@@ -23,16 +28,145 @@ from .vpn_profile import VPNProfile
 
 LOGGER = get_logging_manager().logger
 PASSWORD_PROMPT_RE = re.compile(r"password", re.IGNORECASE)
+# Group 1 captures the PPP/TUN interface name, group 2 flags tunnel
+# establishment and group 3 the SAML authentication prompt. The interface
+# branch is a lookahead so it consumes nothing and finditer() still sees any
+# later event on the same line.
+OUTPUT_EVENT_RE = re.compile(
+    r"(?=Interface\b.*?\s((?:ppp|tun)\S*))|(Tunnel is up|Established)|(Authenticate|(?i:browser))"
+)
+SAML_URL_RE = re.compile(r"https?://[^\s\"']+")
+GATEWAY_RE = re.compile(r"remote\s+IP\s+address\s+([0-9a-fA-F:.]+)", re.IGNORECASE)
+# openfortivpn's own password prompt waits for input without a newline.
+# Anchored to the whole pending tail so sudo and polkit prompts never match.
+_PENDING_PROMPT_RE = re.compile(rb"\A\s*VPN account password:\s*\Z")
+# Superset of every pattern the line handlers look for; most output lines
+# match none of them and are dismissed after this single scan.
+_INTEREST_RE = re.compile(
+    r"Interface|Tunnel is up|Established|Authenticate|browser|remote\s+IP\s+address|password",
+    re.IGNORECASE,
+)
+# Room for openfortivpn to keep writing while the reader is busy in a
+# synchronous route update; F_SETPIPE_SZ needs Linux and Python 3.10+.
+_OUTPUT_PIPE_SIZE = 1 << 20
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", None)
+# Eventfd writes must be eight bytes; a pipe accepts the same token.
+_STOP_TOKEN = (1).to_bytes(8, sys.byteorder)
+
+
+class _OutputEvents(NamedTuple):
+    interface: Optional[str]
+    tunnel_up: bool
+    saml_prompt: bool
+
+
+def _scan_output_events(line: str) -> _OutputEvents:
+    """Collect every event on ``line``; one line may report several."""
+    interface: Optional[str] = None
+    tunnel_up = saml_prompt = False
+    for match in OUTPUT_EVENT_RE.finditer(line):
+        interface = interface or match.group(1)
+        tunnel_up = tunnel_up or match.group(2) is not None
+        saml_prompt = saml_prompt or match.group(3) is not None
+    return _OutputEvents(interface, tunnel_up, saml_prompt)
+
+
+def _open_stop_fds() -> Tuple[int, int]:
+    """Return (read_fd, write_fd) that turns readable once signalled.
+
+    An eventfd serves as both ends where available (Linux, Python 3.10+);
+    older interpreters fall back to a non-blocking pipe.
+    """
+    if hasattr(os, "eventfd"):
+        fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        return fd, fd
+    return os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+
+
+def _read_proc_file(path: str) -> bytes:
+    """Read a small /proc file with raw syscalls, skipping io buffer setup."""
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Cheap existence probe: signal 0 performs the permission and pid checks only."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+@functools.lru_cache(maxsize=128)
+def _signature_tokens(signature: Tuple[str, ...]) -> FrozenSet[str]:
+    """Return the argv entries of a signature that identify one tunnel.
+
+    Only the gateway endpoint (and its host half) and a config path qualify;
+    the program name, option flags and bare ports are shared by every
+    profile's process and would match other tunnels.
+    """
+    tokens = set()
+    args = iter(signature[1:])
+    for part in args:
+        if part in ("-c", "--config"):
+            tokens.add(next(args, ""))
+        elif part.startswith("--config="):
+            tokens.add(part.partition("=")[2])
+        elif not part.startswith("-"):
+            tokens |= {part, part.rpartition(":")[0]}
+    tokens.discard("")
+    return frozenset(tokens)
+
+
+@functools.lru_cache(maxsize=64)
+def _host_tokens(host_value: str, port: int, signature_tokens: FrozenSet[str]) -> FrozenSet[str]:
+    """Return the command-line tokens identifying a profile's openfortivpn process."""
+    host_part, separator, port_part = host_value.rpartition(":")
+    base_host = host_part or host_value
+    port_str = str(port)
+    tokens = {host_value, base_host, f"{base_host}:{port_str}", f"{base_host} {port_str}"}
+    if separator and port_part.isdigit():
+        tokens |= {f"{base_host} {port_part}", f"{base_host}:{port_part}"}
+    tokens |= signature_tokens
+    tokens.discard("")
+    return frozenset(tokens)
+
+
+def _cmdline_parts(cmdline: Iterable[str]) -> set[str]:
+    """Return argv entries plus their colon-separated pieces (``host:port``)."""
+    parts = set(cmdline)
+    parts.update(piece for arg in cmdline for piece in arg.split(":") if piece)
+    return parts
 
 
 class VPNSession(QThread):
-    status_changed = Signal(str)
-    log_line = Signal(str)
+    # Every signal carries the profile name so receivers can connect bound
+    # methods directly instead of per-session closures.
+    status_changed = Signal(str, str)
+    log_line = Signal(str, str)
+    # openfortivpn output, one emission per read so bursts cross threads once.
+    log_lines = Signal(str, list)
     connected = Signal(str)
     disconnected = Signal(str)
 
+    # Copy-on-write: writers serialise on the lock and publish a fresh dict,
+    # so readers iterate whatever reference they load without locking.
     _registry_lock = threading.Lock()
     _active_processes: Dict[int, Tuple[Optional[int], str, Tuple[str, ...]]] = {}
+    # Browser launches can stall on the desktop's handler; keep them off the
+    # session thread so the output reader keeps draining the child.
+    _IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="vpn-io")
 
     def __init__(
         self,
@@ -48,36 +182,150 @@ class VPNSession(QThread):
         self._route_manager = route_manager
         self._browser_catalog = browser_catalog or {info.key: info for info in detect_browsers()}
         self._credentials = credentials
+        # Encoded once; answered on every password prompt across reconnects.
+        self._credentials_bytes = f"{credentials[1]}\n".encode("utf-8") if credentials else None
+        self._auth_is_saml = self.profile.auth_type.lower() == "saml"
+        # Bind the per-line handler once so the read loop skips the auth check.
+        self._handle_output = (
+            self._handle_output_saml if self._auth_is_saml else self._handle_output_password
+        )
         self._stop_event = threading.Event()
-        self._process: Optional[subprocess.Popen[str]] = None
+        # Readable once stop() runs so the output selector wakes at once;
+        # opened by run() and closed when it returns.
+        self._stop_fd = self._stop_write_fd = -1
+        self._stop_fd_lock = threading.Lock()
+        self._connected_once = False
+        self._process: Optional[subprocess.Popen[bytes]] = None
+        self._process_pidfd: Optional[int] = None
+        # Keeps the pidfd open while stop() signals through it.
+        self._pidfd_lock = threading.Lock()
+        self._io_futures: List[Future] = []
         self._process_group: Optional[int] = None
         self._interface_name: Optional[str] = None
         self._browser_launched = False
         self._allow_reconnect = True
         self._command_signature: Optional[Tuple[str, ...]] = None
+        self._command_signature_tokens: FrozenSet[str] = frozenset()
+        # The argv depends only on the profile, which is fixed for the life of
+        # a session, so every reconnect reuses the same command.
+        self._gateway_host, _ = self._normalized_host_port()
+        self._argv_template: Tuple[str, ...] = tuple(build_openfortivpn_command(self.profile))
+        self._argv_tokens = _signature_tokens(self._argv_template)
         self._remote_gateway_ip: Optional[str] = None
         self._gateway_route_applied = False
 
+    def _submit_io(self, func, *args) -> None:
+        self._io_futures.append(VPNSession._IO_POOL.submit(func, *args))
+
+    def _wait_for_io(self) -> None:
+        futures, self._io_futures = self._io_futures, []
+        for future in futures:
+            try:
+                future.result()
+            except Exception as exc:
+                LOGGER.error("Background task for %s failed: %s", self.profile.name, exc)
+
     @classmethod
     def _register_process(
         cls, pid: int, pgid: Optional[int], profile: str, signature: Tuple[str, ...]
     ) -> None:
         with cls._registry_lock:
-            cls._active_processes[pid] = (pgid, profile, signature)
+            registry = dict(VPNSession._active_processes)
+            registry[pid] = (pgid, profile, signature)
+            VPNSession._active_processes = registry
 
     @classmethod
     def _unregister_process(cls, pid: int) -> None:
         with cls._registry_lock:
-            cls._active_processes.pop(pid, None)
+            if pid in VPNSession._active_processes:
+                registry = dict(VPNSession._active_processes)
+                del registry[pid]
+                VPNSession._active_processes = registry
 
     @staticmethod
-    def _wait_for_exit(pid: int, timeout: float) -> bool:
+    def _wait_for_exit(
+        pid: int, timeout: float, process: Optional[subprocess.Popen[bytes]] = None
+    ) -> bool:
+        if process is not None and process.pid == pid:
+            # Our own child: waitpid() both blocks until exit and reaps it.
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                return False
+            return True
+        # A pidfd becomes readable the moment the process exits, so the kernel
+        # wakes us instead of polling /proc. Older kernels or interpreters
+        # without pidfd_open fall back to the sleep loop.
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except (OSError, AttributeError):
+            return VPNSession._wait_for_exit_fallback(pid, timeout)
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            ready = poller.poll(int(timeout * 1000))
+        finally:
+            os.close(pidfd)
+        # A readable pidfd already proves the exit; probe only on timeout.
+        return bool(ready) or not _pid_alive(pid)
+
+    @staticmethod
+    def _wait_for_exit_fallback(pid: int, timeout: float) -> bool:
         deadline = time.time() + timeout
         while time.time() < deadline:
-            if not psutil.pid_exists(pid):
+            if not _pid_alive(pid):
                 return True
             time.sleep(0.2)
-        return not psutil.pid_exists(pid)
+        return not _pid_alive(pid)
+
+    @staticmethod
+    def _wait_for_exits(
+        pids: Iterable[int],
+        timeout: float,
+        processes: Optional[Dict[int, subprocess.Popen[bytes]]] = None,
+        pidfds: Optional[Dict[int, int]] = None,
+    ) -> set[int]:
+        """Wait for several processes at once and return the pids still alive.
+
+        Pids with an entry in ``pidfds`` are multiplexed in a single poll();
+        the descriptors remain owned by the caller.
+        """
+        deadline = time.time() + timeout
+        owned = processes or {}
+        descriptors = pidfds or {}
+        polled: Dict[int, int] = {}
+        unsupported: List[int] = []
+        children: List[int] = []
+        for pid in pids:
+            if pid in owned:
+                if owned[pid].poll() is None:
+                    children.append(pid)
+            elif pid in descriptors:
+                polled[descriptors[pid]] = pid
+            elif _pid_alive(pid):
+                unsupported.append(pid)
+        survivors: set[int] = set()
+        if polled:
+            poller = select.poll()
+            for pidfd in polled:
+                poller.register(pidfd, select.POLLIN)
+            while polled:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                for pidfd, _event in poller.poll(int(remaining * 1000)):
+                    poller.unregister(pidfd)
+                    polled.pop(pidfd, None)
+            survivors.update(polled.values())
+        for pid in unsupported:
+            if not VPNSession._wait_for_exit_fallback(pid, max(0.0, deadline - time.time())):
+                survivors.add(pid)
+        for pid in children:
+            if not VPNSession._wait_for_exit(pid, max(0.0, deadline - time.time()), owned[pid]):
+                survivors.add(pid)
+        return survivors
 
     @staticmethod
     def _send_signal_group(
@@ -130,9 +378,19 @@ class VPNSession(QThread):
             return False
 
     @staticmethod
-    def _send_signal_pid(pid: int, sig: signal.Signals, privilege: PrivilegeManager, profile: str) -> bool:
+    def _send_signal_pid(
+        pid: int,
+        sig: signal.Signals,
+        privilege: PrivilegeManager,
+        profile: str,
+        pidfd: Optional[int] = None,
+    ) -> bool:
         try:
-            os.kill(pid, sig)
+            if pidfd is not None:
+                # Bound to the process instance, so a recycled pid cannot be hit.
+                signal.pidfd_send_signal(pidfd, sig)
+            else:
+                os.kill(pid, sig)
             return True
         except PermissionError:
             LOGGER.debug(
@@ -183,75 +441,96 @@ class VPNSession(QThread):
         privilege: PrivilegeManager,
         profile: str,
         forced: bool = False,
-    ) -> None:
-        if pid <= 0:
-            return
-        if not psutil.pid_exists(pid):
-            cls._unregister_process(pid)
-            return
-        action = "Force terminating" if forced else "Stopping"
-        LOGGER.info("[%s] %s openfortivpn pid %s", profile, action, pid)
-        delivered = cls._send_signal_group(pgid, signal.SIGTERM, privilege, profile)
-        if not delivered:
-            cls._send_signal_pid(pid, signal.SIGTERM, privilege, profile)
-        if not cls._wait_for_exit(pid, 10):
-            LOGGER.warning("[%s] openfortivpn pid %s still running; escalating", profile, pid)
-            cls._send_signal_group(pgid, signal.SIGKILL, privilege, profile)
-            cls._send_signal_pid(pid, signal.SIGKILL, privilege, profile)
-            if not cls._wait_for_exit(pid, 5):
-                LOGGER.error("[%s] openfortivpn pid %s did not terminate", profile, pid)
-        if not psutil.pid_exists(pid):
-            cls._unregister_process(pid)
+        process: Optional[subprocess.Popen[bytes]] = None,
+        pidfd: Optional[int] = None,
+    ) -> bool:
+        processes = {pid: process} if process is not None else None
+        pidfds = {pid: pidfd} if pidfd is not None else None
+        return cls._terminate_many([(pid, pgid, profile)], privilege, forced, processes, pidfds)
+
+    @classmethod
+    def _terminate_many(
+        cls,
+        entries: Iterable[Tuple[int, Optional[int], str]],
+        privilege: PrivilegeManager,
+        forced: bool = False,
+        processes: Optional[Dict[int, subprocess.Popen[bytes]]] = None,
+        pidfds: Optional[Dict[int, int]] = None,
+    ) -> bool:
+        """Terminate several openfortivpn processes, waiting on them concurrently.
+
+        ``processes`` maps pids we spawned to their Popen handles so those are
+        waited on (and reaped) with waitpid() rather than via /proc.
+        ``pidfds`` lends already-open pidfds, which stay owned by the caller.
+        Returns True when every entry is gone afterwards.
+        """
+        owned = processes or {}
+        borrowed = pidfds or {}
+        targets: Dict[int, Tuple[Optional[int], str]] = {}
+        opened: Dict[int, int] = {}
+        try:
+            for pid, pgid, profile in entries:
+                if pid <= 0 or pid in targets:
+                    continue
+                exited = owned[pid].poll() is not None if pid in owned else not _pid_alive(pid)
+                if exited:
+                    cls._unregister_process(pid)
+                    continue
+                targets[pid] = (pgid, profile)
+                if pid in owned or pid in borrowed:
+                    continue
+                try:
+                    opened[pid] = os.pidfd_open(pid)
+                except ProcessLookupError:
+                    cls._unregister_process(pid)
+                    del targets[pid]
+                except (OSError, AttributeError):
+                    continue
+            pidfds = {**borrowed, **opened}
+            action = "Force terminating" if forced else "Stopping"
+            for pid, (pgid, profile) in targets.items():
+                LOGGER.info("[%s] %s openfortivpn pid %s", profile, action, pid)
+                if not cls._send_signal_group(pgid, signal.SIGTERM, privilege, profile):
+                    cls._send_signal_pid(pid, signal.SIGTERM, privilege, profile, pidfds.get(pid))
+            survivors = cls._wait_for_exits(targets, 10, owned, pidfds)
+            if survivors:
+                for pid in survivors:
+                    pgid, profile = targets[pid]
+                    LOGGER.warning("[%s] openfortivpn pid %s still running; escalating", profile, pid)
+                    if not cls._send_signal_group(pgid, signal.SIGKILL, privilege, profile):
+                        cls._send_signal_pid(pid, signal.SIGKILL, privilege, profile, pidfds.get(pid))
+                survivors = cls._wait_for_exits(survivors, 5, owned, pidfds)
+                for pid in survivors:
+                    LOGGER.error("[%s] openfortivpn pid %s did not terminate", targets[pid][1], pid)
+        finally:
+            for pidfd in opened.values():
+                os.close(pidfd)
+        for pid in targets:
+            if pid not in survivors:
+                cls._unregister_process(pid)
+        return not survivors
 
     @classmethod
     def _tracked_processes_for_profile(
         cls, profile: str
     ) -> List[Tuple[int, Optional[int], Tuple[str, ...]]]:
-        with cls._registry_lock:
-            return [
-                (pid, data[0], data[2])
-                for pid, data in cls._active_processes.items()
-                if data[1] == profile
-            ]
+        return [
+            (pid, data[0], data[2])
+            for pid, data in cls._active_processes.items()
+            if data[1] == profile
+        ]
 
     @staticmethod
     def _build_host_tokens(
-        profile: VPNProfile, signatures: Optional[Iterable[Tuple[str, ...]]] = None
-    ) -> List[str]:
-        tokens: set[str] = set()
-        host_value = profile.host or ""
-        base_host = host_value
-        detected_port: Optional[str] = None
-        if ":" in host_value:
-            host_part, _, port_part = host_value.rpartition(":")
-            if host_part:
-                base_host = host_part
-            if port_part.isdigit():
-                detected_port = port_part
-        port_str = str(profile.port)
-        tokens.update({host_value, base_host, f"{base_host}:{port_str}", f"{base_host} {port_str}"})
-        tokens.add(port_str)
-        if detected_port:
-            tokens.add(detected_port)
-            tokens.add(f"{base_host} {detected_port}")
-            tokens.add(f"{base_host}:{detected_port}")
-        if profile.auth_type.lower() == "saml":
-            tokens.add("--saml-login")
-            if profile.saml_port:
-                tokens.add(str(profile.saml_port))
+        profile: VPNProfile,
+        signatures: Optional[Iterable[Tuple[str, ...]]] = None,
+        signature_tokens: FrozenSet[str] = frozenset(),
+    ) -> FrozenSet[str]:
+        # The cache is keyed on the profile's field values rather than the
+        # object, so editing a profile simply misses and rebuilds.
         if signatures:
-            for signature in signatures:
-                for part in signature:
-                    if not part:
-                        continue
-                    tokens.add(part)
-                    if ":" in part:
-                        base, _, remainder = part.rpartition(":")
-                        if base:
-                            tokens.add(base)
-                        if remainder:
-                            tokens.add(remainder)
-        return [token for token in tokens if token]
+            signature_tokens = signature_tokens.union(*map(_signature_tokens, signatures))
+        return _host_tokens(profile.host or "", profile.port, signature_tokens)
 
     @classmethod
     def _terminate_signature_matches(
@@ -260,32 +539,63 @@ class VPNSession(QThread):
         privilege: PrivilegeManager,
         forced: bool = False,
         signatures: Optional[List[Tuple[str, ...]]] = None,
+        signature_tokens: FrozenSet[str] = frozenset(),
     ) -> None:
-        host_tokens = cls._build_host_tokens(profile, signatures)
-        with cls._registry_lock:
-            tracked = set(cls._active_processes.keys())
-        for proc in psutil.process_iter(["pid", "name", "cmdline"]):
+        matches = cls._find_signature_matches(profile, signatures, signature_tokens)
+        cls._terminate_many(matches, privilege, forced)
+
+    @classmethod
+    def _find_signature_matches(
+        cls,
+        profile: VPNProfile,
+        signatures: Optional[List[Tuple[str, ...]]] = None,
+        signature_tokens: FrozenSet[str] = frozenset(),
+    ) -> List[Tuple[int, Optional[int], str]]:
+        host_tokens = cls._build_host_tokens(profile, signatures, signature_tokens)
+        if not host_tokens:
+            return []
+        # Match whole argv entries so a host such as vpn.example.com cannot
+        # hit vpn.example.com.au.
+        matches: List[Tuple[int, Optional[int], str]] = []
+        for pid, cmdline in cls._untracked_openfortivpn_processes():
+            if host_tokens.isdisjoint(_cmdline_parts(cmdline)):
+                continue
+            matches.append((pid, cls._process_group_of(pid), profile.name))
+        return matches
+
+    @classmethod
+    def _untracked_openfortivpn_processes(cls) -> Iterator[Tuple[int, List[str]]]:
+        """Yield (pid, cmdline) for openfortivpn processes not in the registry.
+
+        Only /proc/<pid>/comm is read for most processes; the command line is
+        opened solely for openfortivpn instances.
+        """
+        tracked = cls._active_processes
+        try:
+            with os.scandir("/proc") as entries:
+                pids = [int(entry.name) for entry in entries if entry.name.isdigit()]
+        except OSError as exc:
+            LOGGER.warning("Unable to scan /proc for openfortivpn processes: %s", exc)
+            return
+        for pid in pids:
+            if pid in tracked:
+                continue
             try:
-                if proc.pid in tracked:
-                    continue
-                name = proc.info.get("name") or ""
-                cmdline = proc.info.get("cmdline") or []
-                if not cmdline and hasattr(proc, "cmdline"):
-                    cmdline = proc.cmdline()
-                if not cmdline:
-                    continue
-                identifier = " ".join(cmdline)
-                if "openfortivpn" not in name and "openfortivpn" not in cmdline[0]:
-                    continue
-                if not any(token in identifier for token in host_tokens):
+                if _read_proc_file(f"/proc/{pid}/comm") != b"openfortivpn\n":
                     continue
-                try:
-                    pgid = os.getpgid(proc.pid)
-                except Exception:
-                    pgid = None
-                cls._terminate_entry(proc.pid, pgid, privilege, profile.name, forced)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                raw = _read_proc_file(f"/proc/{pid}/cmdline")
+            except (FileNotFoundError, ProcessLookupError, PermissionError):
                 continue
+            cmdline = [part.decode("utf-8", "replace") for part in raw.split(b"\0") if part]
+            if cmdline:
+                yield pid, cmdline
+
+    @staticmethod
+    def _process_group_of(pid: int) -> Optional[int]:
+        try:
+            return os.getpgid(pid)
+        except Exception:
+            return None
 
     @classmethod
     def cleanup_profile_processes(
@@ -294,53 +604,90 @@ class VPNSession(QThread):
         privilege: PrivilegeManager,
         forced: bool = False,
         signature: Optional[Tuple[str, ...]] = None,
+        signature_tokens: FrozenSet[str] = frozenset(),
+        scan_orphans: bool = False,
     ) -> None:
+        """Terminate a profile's tracked processes, then hunt for strays.
+
+        The registry is authoritative for processes we spawned, so the /proc
+        walk is skipped when every tracked process was reaped and the caller
+        supplied no signature to hunt for. ``scan_orphans`` forces the walk
+        (forced cleanup after a hung disconnect).
+        """
         tracked_signatures: List[Tuple[str, ...]] = []
+        entries: List[Tuple[int, Optional[int], str]] = []
         for pid, pgid, tracked_signature in cls._tracked_processes_for_profile(profile.name):
             if tracked_signature:
                 tracked_signatures.append(tracked_signature)
-            cls._terminate_entry(pid, pgid, privilege, profile.name, forced)
+            entries.append((pid, pgid, profile.name))
+        reaped = cls._terminate_many(entries, privilege, forced)
+        if reaped and not (scan_orphans or signature or signature_tokens):
+            return
         if signature:
             tracked_signatures.append(signature)
-        cls._terminate_signature_matches(profile, privilege, forced, tracked_signatures or None)
+        cls._terminate_signature_matches(
+            profile, privilege, forced, tracked_signatures or None, signature_tokens
+        )
 
     @classmethod
     def terminate_orphaned_processes(cls, privilege: PrivilegeManager) -> None:
-        with cls._registry_lock:
-            entries = list(cls._active_processes.items())
-        for pid, (pgid, profile, _signature) in entries:
-            cls._terminate_entry(pid, pgid, privilege, profile, True)
+        entries = cls._active_processes.items()
+        cls._terminate_many(
+            [(pid, pgid, profile) for pid, (pgid, profile, _signature) in entries],
+            privilege,
+            True,
+        )
 
     @classmethod
     def cleanup_all_profiles(
         cls, profiles: Iterable[VPNProfile], privilege: PrivilegeManager
     ) -> None:
-        seen: set[str] = set()
+        profile_tokens: Dict[str, FrozenSet[str]] = {}
         for profile in profiles:
-            key = profile.name
-            if key in seen:
-                continue
-            seen.add(key)
-            cls._terminate_signature_matches(profile, privilege, True)
+            if profile.name not in profile_tokens:
+                profile_tokens[profile.name] = cls._build_host_tokens(profile)
+        if not profile_tokens:
+            return
+        # One pass over the process table serves every profile; argv entries
+        # are matched by set membership instead of substring scans.
+        matches: List[Tuple[int, Optional[int], str]] = []
+        for pid, cmdline in cls._untracked_openfortivpn_processes():
+            parts = _cmdline_parts(cmdline)
+            for name, tokens in profile_tokens.items():
+                if not tokens.isdisjoint(parts):
+                    matches.append((pid, cls._process_group_of(pid), name))
+                    break
+        cls._terminate_many(matches, privilege, True)
 
     def stop(self) -> None:
         self._allow_reconnect = False
         self._stop_event.set()
-        self.status_changed.emit("Disconnecting")
+        with self._stop_fd_lock:
+            if self._stop_write_fd >= 0:
+                try:
+                    os.write(self._stop_write_fd, _STOP_TOKEN)
+                except OSError:
+                    pass
+        self.status_changed.emit(self.profile.name, "Disconnecting")
         process = self._process
         if process and process.poll() is None:
-            pgid = self._process_group
-            if pgid is None:
-                try:
-                    pgid = os.getpgid(process.pid)
-                except Exception:
-                    pgid = None
-            self._terminate_entry(process.pid, pgid, self._privilege_manager, self.profile.name)
+            with self._pidfd_lock:
+                self._terminate_entry(
+                    process.pid,
+                    process.pid,
+                    self._privilege_manager,
+                    self.profile.name,
+                    process=process,
+                    pidfd=self._process_pidfd,
+                )
         VPNSession.cleanup_profile_processes(
             self.profile,
             self._privilege_manager,
             True,
-            self._command_signature,
+            signature_tokens=self._command_signature_tokens,
+            # A sudo wrapper or a SIGKILL escalation can leave openfortivpn
+            # behind even after the tracked pid is reaped.
+            scan_orphans=True,
         )
         self._route_manager.cleanup(self.profile.name)
         self._interface_name = None
@@ -349,9 +696,17 @@ class VPNSession(QThread):
         self._gateway_route_applied = False
 
     def run(self) -> None:
+        with self._stop_fd_lock:
+            self._stop_fd, self._stop_write_fd = _open_stop_fds()
+        try:
+            self._run_sessions()
+        finally:
+            self._close_stop_fds()
+
+    def _run_sessions(self) -> None:
         backoff = 5
         while not self._stop_event.is_set():
-            self.status_changed.emit("Starting")
+            self.status_changed.emit(self.profile.name, "Starting")
             success = self._run_once()
             if self._stop_event.is_set() or not self.profile.auto_reconnect or not self._allow_reconnect:
                 break
@@ -359,36 +714,42 @@ class VPNSession(QThread):
                 backoff = 5
             else:
                 backoff = min(backoff * 2, 60)
-            self.status_changed.emit(f"Reconnecting in {backoff}s")
-            for _ in range(backoff):
-                if self._stop_event.is_set():
-                    break
-                time.sleep(1)
-        self.status_changed.emit("Stopped")
+            self.status_changed.emit(self.profile.name, f"Reconnecting in {backoff}s")
+            if self._stop_event.wait(backoff):
+                break
+        self.status_changed.emit(self.profile.name, "Stopped")
+        self._wait_for_io()
         VPNSession.cleanup_profile_processes(
             self.profile,
             self._privilege_manager,
-            signature=self._command_signature,
+            signature_tokens=self._command_signature_tokens,
         )
 
+    def _close_stop_fds(self) -> None:
+        with self._stop_fd_lock:
+            for fd in {self._stop_fd, self._stop_write_fd}:
+                if fd >= 0:
+                    os.close(fd)
+            self._stop_fd = self._stop_write_fd = -1
+
     def _run_once(self) -> bool:
         self._browser_launched = False
         self._interface_name = None
         self._remote_gateway_ip = None
         self._gateway_route_applied = False
-        host, _ = self._normalized_host_port()
         if self._route_manager:
-            self._route_manager.record_gateway_hint(self.profile.name, host)
-        command = self._build_command()
-        self._command_signature = tuple(command)
+            self._route_manager.record_gateway_hint(self.profile.name, self._gateway_host)
+        command = list(self._argv_template)
+        self._command_signature = self._argv_template
+        self._command_signature_tokens = self._argv_tokens
         LOGGER.debug("Launching openfortivpn for profile %s", self.profile.name)
         try:
             argv, password = self._privilege_manager.build_command(command)
         except RuntimeError as exc:
             message = f"Privilege escalation failed: {exc}"
             LOGGER.error(message)
-            self.status_changed.emit("Privilege error")
-            self.log_line.emit(message)
+            self.status_changed.emit(self.profile.name, "Privilege error")
+            self.log_line.emit(self.profile.name, message)
             return False
         if self._stop_event.is_set():
             return False
@@ -398,15 +759,24 @@ class VPNSession(QThread):
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
+                bufsize=0,
                 start_new_session=True,
             )
+            # start_new_session makes the child a session and group leader,
+            # so its pgid is its pid by construction.
+            self._process_group = self._process.pid
             try:
-                self._process_group = os.getpgid(self._process.pid)
-            except Exception:
-                self._process_group = None
+                # Held for the process lifetime: it wakes the output selector on
+                # exit and lets signals target this exact process instance.
+                self._process_pidfd = os.pidfd_open(self._process.pid)
+            except (OSError, AttributeError):
+                self._process_pidfd = None
+            if _F_SETPIPE_SZ is not None and self._process.stdout:
+                try:
+                    fcntl.fcntl(self._process.stdout.fileno(), _F_SETPIPE_SZ, _OUTPUT_PIPE_SIZE)
+                except OSError:
+                    # Capped by fs.pipe-max-size or the user's pipe quota.
+                    pass
             VPNSession._register_process(
                 self._process.pid,
                 self._process_group,
@@ -416,57 +786,147 @@ class VPNSession(QThread):
         except FileNotFoundError:
             message = "openfortivpn binary not found"
             LOGGER.error(message)
-            self.status_changed.emit("Binary missing")
-            self.log_line.emit(message)
+            self.status_changed.emit(self.profile.name, "Binary missing")
+            self.log_line.emit(self.profile.name, message)
             return False
-        if password and self._process.stdin:
-            self._process.stdin.write(password + "\n")
-            self._process.stdin.flush()
-        connected_once = False
-        while not self._stop_event.is_set():
-            line = self._process.stdout.readline() if self._process.stdout else ""
-            if not line:
-                if self._process.poll() is not None:
-                    break
-                time.sleep(0.1)
-                continue
-            cleaned = line.strip()
-            if not cleaned:
-                continue
-            self.log_line.emit(cleaned)
-            LOGGER.debug("%s", cleaned)
-            self._handle_output(cleaned)
-            if ("Tunnel is up" in cleaned or "Established" in cleaned) and not connected_once:
-                connected_once = True
-                self.status_changed.emit("Connected")
-                self.connected.emit(self.profile.name)
-        self._route_manager.cleanup(self.profile.name)
+        if password:
+            self._write_stdin(f"{password}\n".encode("utf-8"))
+        self._connected_once = False
+        self._read_output()
         self._interface_name = None
-        pid = self._process.pid if self._process else None
-        rc = self._process.wait() if self._process else 0
+        process = self._process
+        if process and not self._stop_event.is_set():
+            # The reader gave up on a live child (closed stdout); terminate it
+            # through the owned-child path so waitpid() reaps it. stop() owns
+            # termination once it has been called.
+            with self._pidfd_lock:
+                if process.poll() is None:
+                    self._terminate_entry(
+                        process.pid,
+                        self._process_group,
+                        self._privilege_manager,
+                        self.profile.name,
+                        process=process,
+                        pidfd=self._process_pidfd,
+                    )
+        pid = process.pid if process else None
+        rc = process.wait() if process else 0
+        # Routes are released before anyone hears of the disconnect, so a
+        # reconnect of this profile never races the old session's cleanup.
+        self._route_manager.cleanup(self.profile.name)
         self.disconnected.emit(self.profile.name)
-        self.status_changed.emit("Disconnected")
+        self.status_changed.emit(self.profile.name, "Disconnected")
         if rc != 0:
-            self.log_line.emit(f"Process exited with code {rc}")
+            self.log_line.emit(self.profile.name, f"Process exited with code {rc}")
         if pid is not None:
             VPNSession._unregister_process(pid)
+        self._close_process_pidfd()
         self._process = None
         self._process_group = None
         self._command_signature = None
-        return connected_once
-
-    def _build_command(self) -> list[str]:
-        host, port = self._normalized_host_port()
-        command = ["openfortivpn", f"{host}:{port}"]
-        if self.profile.auth_type.lower() == "saml":
-            if self.profile.saml_port:
-                command.append(f"--saml-login={self.profile.saml_port}")
-            else:
-                command.append("--saml-login")
-        else:
-            if self.profile.username:
-                command.append(f"--username={self.profile.username}")
-        return command
+        self._command_signature_tokens = frozenset()
+        return self._connected_once
+
+    def _close_process_pidfd(self) -> None:
+        with self._pidfd_lock:
+            pidfd, self._process_pidfd = self._process_pidfd, None
+        if pidfd is not None:
+            os.close(pidfd)
+
+    def _read_output(self) -> None:
+        """Dispatch openfortivpn output until the process exits or stop() is called.
+
+        The thread sleeps in the selector until stdout is readable, the child
+        exits (via its pidfd) or stop() signals the stop descriptor, so log
+        lines and disconnect requests are handled without polling.
+        """
+        process = self._process
+        if not process or not process.stdout:
+            return
+        stdout_fd = process.stdout.fileno()
+        os.set_blocking(stdout_fd, False)
+        selector = selectors.DefaultSelector()
+        selector.register(stdout_fd, selectors.EVENT_READ, "stdout")
+        if self._stop_fd >= 0:
+            selector.register(self._stop_fd, selectors.EVENT_READ, "stop")
+        pidfd = self._process_pidfd
+        if pidfd is not None:
+            selector.register(pidfd, selectors.EVENT_READ, "exit")
+        # With a pidfd the child's exit wakes the selector itself; only the
+        # fallback needs a periodic poll() to notice it.
+        poll_interval = None if pidfd is not None else 1.0
+        pending = bytearray()
+        try:
+            finished = False
+            while not finished and not self._stop_event.is_set():
+                events = selector.select(timeout=poll_interval)
+                if not events and process.poll() is not None:
+                    break
+                for key, _mask in events:
+                    if key.data == "stdout":
+                        received = self._dispatch_output(stdout_fd, pending)
+                        finished = finished or received == 0
+                    elif key.data == "exit":
+                        # Flush whatever the child wrote before exiting.
+                        received = 1
+                        while received > 0:
+                            received = self._dispatch_output(stdout_fd, pending)
+                        finished = True
+                    else:
+                        finished = True
+            if pending:
+                self._handle_lines([bytes(pending)])
+        finally:
+            selector.close()
+
+    def _dispatch_output(self, fd: int, pending: bytearray) -> int:
+        """Read available output into ``pending`` and emit complete lines.
+
+        Returns the number of bytes read: zero at end-of-file and -1 when no
+        data was ready. The unterminated remainder stays in ``pending`` unless
+        it is a password prompt waiting for input.
+        """
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            return -1
+        if not chunk:
+            return 0
+        pending += chunk
+        newline = pending.rfind(b"\n")
+        if newline >= 0:
+            complete = bytes(pending[:newline])
+            del pending[: newline + 1]
+            self._handle_lines(complete.split(b"\n"))
+        if pending and _PENDING_PROMPT_RE.search(pending):
+            # The prompt stays unterminated until answered, so hand it over
+            # now instead of waiting for a newline that never arrives.
+            self._handle_lines([bytes(pending)])
+            pending.clear()
+        return len(chunk)
+
+    def _handle_lines(self, raw_lines: List[bytes]) -> None:
+        lines = [line for line in (raw.decode("utf-8", "replace").strip() for raw in raw_lines) if line]
+        if not lines:
+            return
+        self.log_lines.emit(self.profile.name, lines)
+        # A connected consumer records the lines itself, so only log them here
+        # when nothing listens and each line is formatted once either way.
+        if not self.receivers(self.log_lines):
+            for line in lines:
+                LOGGER.debug("[%s] %s", self.profile.name, line)
+        for line in lines:
+            self._handle_line(line)
+
+    def _handle_line(self, cleaned: str) -> None:
+        if not _INTEREST_RE.search(cleaned):
+            return
+        events = _scan_output_events(cleaned)
+        self._handle_output(cleaned, events)
+        if events.tunnel_up and not self._connected_once:
+            self._connected_once = True
+            self.status_changed.emit(self.profile.name, "Connected")
+            self.connected.emit(self.profile.name)
 
     def _normalized_host_port(self) -> Tuple[str, int]:
         host = self.profile.host or ""
@@ -484,31 +944,42 @@ class VPNSession(QThread):
     def command_signature(self) -> Optional[Tuple[str, ...]]:
         return self._command_signature
 
-    def _handle_output(self, line: str) -> None:
+    def _handle_output_password(self, line: str, events: Optional[_OutputEvents] = None) -> None:
         if self._stop_event.is_set():
             return
+        self._capture_interface(line, events)
+        self._handle_gateway_or_prompt(line)
+
+    def _handle_output_saml(self, line: str, events: Optional[_OutputEvents] = None) -> None:
+        if self._stop_event.is_set():
+            return
+        events = self._capture_interface(line, events)
+        if not self._browser_launched and events.saml_prompt:
+            # The authenticate line is usually wrapped in single quotes by
+            # openfortivpn (e.g. Authenticate at 'https://host/path').
+            # Extract the URL without any trailing quotes so the browser
+            # receives a clean location and does not percent-encode the
+            # quote character into the request.
+            start = line.find("http")
+            match = SAML_URL_RE.search(line, start) if start >= 0 else None
+            if match:
+                url = match.group(0).rstrip("'\"")
+                self._launch_browser(url)
+                self._browser_launched = True
+        self._handle_gateway_or_prompt(line)
+
+    def _capture_interface(self, line: str, events: Optional[_OutputEvents]) -> _OutputEvents:
+        if events is None:
+            events = _scan_output_events(line)
         # Capture the interface name as soon as it appears so route management
         # receives an explicit hint instead of falling back to interface
         # detection that can miss already-established PPP/TUN devices.
-        if "Interface" in line and ("ppp" in line or "tun" in line):
-            parts = line.split()
-            for part in parts:
-                if part.startswith("ppp") or part.startswith("tun"):
-                    self._interface_name = part
-                    break
-        if self.profile.auth_type.lower() == "saml":
-            if not self._browser_launched and ("Authenticate" in line or "browser" in line.lower()):
-                # The authenticate line is usually wrapped in single quotes by
-                # openfortivpn (e.g. Authenticate at 'https://host/path').
-                # Extract the URL without any trailing quotes so the browser
-                # receives a clean location and does not percent-encode the
-                # quote character into the request.
-                match = re.search(r"https?://[^\s\"']+", line)
-                if match:
-                    url = match.group(0).rstrip("'\"")
-                    self._launch_browser(url)
-                    self._browser_launched = True
-        gateway_match = re.search(r"remote\s+IP\s+address\s+([0-9a-fA-F:.]+)", line, re.IGNORECASE)
+        if events.interface:
+            self._interface_name = events.interface
+        return events
+
+    def _handle_gateway_or_prompt(self, line: str) -> None:
+        gateway_match = GATEWAY_RE.search(line)
         if gateway_match:
             self._remote_gateway_ip = gateway_match.group(1)
             if self._route_manager and not self._gateway_route_applied:
@@ -517,11 +988,19 @@ class VPNSession(QThread):
                 )
                 self._gateway_route_applied = True
         else:
-            if PASSWORD_PROMPT_RE.search(line) and self._process and self._process.stdin:
-                if self._credentials:
-                    _, password = self._credentials
-                    self._process.stdin.write(password + "\n")
-                    self._process.stdin.flush()
+            if self._credentials_bytes and PASSWORD_PROMPT_RE.search(line):
+                self._write_stdin(self._credentials_bytes)
+
+    def _write_stdin(self, data: bytes) -> None:
+        # stdin is unbuffered, so a raw write skips the file object entirely;
+        # a short password fits in PIPE_BUF and needs no flush.
+        process = self._process
+        if not process or not process.stdin:
+            return
+        try:
+            os.write(process.stdin.fileno(), data)
+        except OSError as exc:
+            LOGGER.debug("[%s] Unable to write to openfortivpn stdin: %s", self.profile.name, exc)
 
     def interface_name(self) -> Optional[str]:
         """Expose the detected VPN interface for manual route operations."""
@@ -530,20 +1009,24 @@ class VPNSession(QThread):
     def apply_routes(self) -> bool:
         """Apply custom routes on demand when triggered from the UI."""
         if not self.profile.routes:
-            self.log_line.emit("No custom routes are configured for this profile.")
+            self.log_line.emit(self.profile.name, "No custom routes are configured for this profile.")
             return False
         if not self._route_manager:
-            self.log_line.emit("Route manager unavailable; cannot apply routes.")
+            self.log_line.emit(self.profile.name, "Route manager unavailable; cannot apply routes.")
             return False
         if self._remote_gateway_ip and self._route_manager:
             self._route_manager.ensure_gateway_route(
                 self.profile.name, self._remote_gateway_ip
             )
         if not self._process or self._process.poll() is not None:
-            self.log_line.emit("VPN process is not running; connect before applying routes.")
+            self.log_line.emit(
+                self.profile.name, "VPN process is not running; connect before applying routes."
+            )
             return False
         if not self._interface_name:
-            self.log_line.emit("VPN interface not yet detected; wait for connection to complete.")
+            self.log_line.emit(
+                self.profile.name, "VPN interface not yet detected; wait for connection to complete."
+            )
             return False
         self._route_manager.apply_routes(
             self.profile.name,
@@ -553,6 +1036,9 @@ class VPNSession(QThread):
         return True
 
     def _launch_browser(self, url: str) -> None:
+        self._submit_io(self._open_browser, url)
+
+    def _open_browser(self, url: str) -> None:
         browser_key = self.profile.browser
         if not browser_key or browser_key == "system":
             webbrowser.open(url)
@@ -561,14 +1047,11 @@ class VPNSession(QThread):
         if not info:
             webbrowser.open(url)
             return
-        args = [info.executable, url]
+        args = [info.executable]
         profile = self.profile.browser_profile
         if profile:
-            if info.key == "firefox":
-                args.insert(1, "-P")
-                args.insert(2, profile)
-            else:
-                args.insert(1, f"--profile-directory={profile}")
+            args.extend(profile_arguments(info.key, profile))
+        args.append(url)
         try:
             subprocess.Popen(args)
         except Exception as exc:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from core.qt_compat import (
     QCheckBox,
@@ -27,11 +27,39 @@ from core.vpn_profile import VPNProfile
 class ProfileDialog(QDialog):
     """Dialog allowing the user to add or edit VPN profiles."""
 
-    def __init__(self, browsers: List[BrowserInfo], profile: Optional[VPNProfile] = None, parent=None) -> None:
+    # One hidden instance is kept per parent window and reset between uses;
+    # only ever touched from the GUI thread.
+    _cached_instance: Optional["ProfileDialog"] = None
+
+    @classmethod
+    def obtain(
+        cls,
+        browsers: List[BrowserInfo],
+        profile: Optional[VPNProfile] = None,
+        parent=None,
+        browsers_by_key: Optional[Dict[str, BrowserInfo]] = None,
+    ) -> "ProfileDialog":
+        """Return the cached dialog reset for ``profile``, building it on first use."""
+        dialog = cls._cached_instance
+        if dialog is None or dialog.parent() is not parent or dialog._browsers is not browsers:
+            dialog = cls(browsers, profile=profile, parent=parent, browsers_by_key=browsers_by_key)
+            cls._cached_instance = dialog
+        else:
+            dialog.reset(profile)
+        return dialog
+
+    def __init__(
+        self,
+        browsers: List[BrowserInfo],
+        profile: Optional[VPNProfile] = None,
+        parent=None,
+        browsers_by_key: Optional[Dict[str, BrowserInfo]] = None,
+    ) -> None:
         super().__init__(parent)
         self.setWindowTitle("VPN Profile")
         self.setModal(True)
         self._browsers = browsers
+        self._browsers_by_key = browsers_by_key or {browser.key: browser for browser in browsers}
         self._profile = profile
         self._build_ui()
         if profile:
@@ -89,6 +117,24 @@ class ProfileDialog(QDialog):
         self._update_profile_combo()
         self._on_auth_changed(self.auth_combo.currentText())
 
+    def reset(self, profile: Optional[VPNProfile] = None) -> None:
+        """Restore the defaults set by _build_ui, then load ``profile`` if given."""
+        self._profile = profile
+        self.name_edit.clear()
+        self.host_edit.clear()
+        self.port_spin.setValue(443)
+        self.auth_combo.setCurrentIndex(0)
+        self.custom_saml_check.setChecked(False)
+        self.saml_port_spin.setValue(8020)
+        self.browser_combo.setCurrentIndex(0)
+        self._update_profile_combo()
+        self.username_edit.clear()
+        self.auto_reconnect_check.setChecked(False)
+        self.routes_edit.clear()
+        self._on_auth_changed(self.auth_combo.currentText())
+        if profile:
+            self._populate(profile)
+
     def _populate(self, profile: VPNProfile) -> None:
         self.name_edit.setText(profile.name)
         self.host_edit.setText(profile.host)
@@ -116,13 +162,11 @@ class ProfileDialog(QDialog):
 
     def _update_profile_combo(self) -> None:
         self.profile_combo.clear()
-        browser_key = self.browser_combo.currentData()
-        for browser in self._browsers:
-            if browser.key == browser_key:
-                self.profile_combo.addItem("(Default)", "")
-                for profile in browser.profiles:
-                    self.profile_combo.addItem(profile, profile)
-                break
+        browser = self._browsers_by_key.get(self.browser_combo.currentData())
+        if browser:
+            self.profile_combo.addItem("(Default)", "")
+            for profile in browser.profiles:
+                self.profile_combo.addItem(profile, profile)
 
     def _on_auth_changed(self, value: str) -> None:
         is_saml = value.lower() == "saml"
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Tuple
 
 from core.qt_compat import (
     QAction,
@@ -17,6 +20,8 @@ from core.qt_compat import (
     QSplitter,
     QTableWidget,
     QTableWidgetItem,
+    QTextCursor,
+    QTimer,
     QToolBar,
     QWidget,
     Qt,
@@ -32,10 +37,13 @@ from core.privilege import PrivilegeManager
 from core.routing import RouteManager
 from core.vpn_profile import VPNProfile
 from core.vpn_session import VPNSession
-from gui.dialogs import CredentialDialog, ProfileDialog, SudoPasswordDialog
 from gui.styles import DARK_THEME_QSS
 
 
+# Status and Actions follow their contents; every other column stretches.
+_CONTENT_SIZED_COLUMNS = (8, 9)
+
+
 class _LogEmitter(QObject):
     log_received = Signal(str)
 
@@ -59,16 +67,33 @@ class MainWindow(QMainWindow):
         self._log_listener = lambda message: self._log_emitter.log_received.emit(message)
 
         self.browsers = detect_browsers()
-        self.browser_catalog: Dict[str, BrowserInfo] = {browser.key: browser for browser in self.browsers}
         self.privilege_manager = PrivilegeManager(self._request_sudo_password)
         self.route_manager = RouteManager(self.privilege_manager)
         self.sessions: Dict[str, VPNSession] = {}
         self.session_status: Dict[str, str] = {}
         self.profile_rows: Dict[str, int] = {}
+        # Cell values each row was last filled with, to skip unchanged rows.
+        self._row_values: List[Tuple[object, ...]] = []
+        # Profiles shown in the table, refreshed with it; row actions resolve
+        # names here while duplicate checks still ask the config manager.
+        self._profile_by_name: Dict[str, VPNProfile] = {}
+        # Log lines are coalesced and appended in one call per timer tick.
+        self._pending_logs: list[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_logs)
+        # Keyring reads can cost a D-Bus round trip each; the selected row's
+        # read starts in the background and its result is consumed once.
+        self._keyring_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="keyring")
+        self._pending_credentials: Optional[Tuple[str, Future]] = None
 
         self._build_ui()
-        for entry in history_snapshot:
-            self._append_log(entry)
+        if history_snapshot:
+            # Replay the backlog in one document update rather than per line.
+            backlog = history_snapshot[-self.log_viewer.maximumBlockCount():]
+            self.log_viewer.setPlainText("\n".join(backlog))
+            self.log_viewer.moveCursor(QTextCursor.MoveOperation.End)
         self.logging_manager.add_listener(self._log_listener)
         self.logging_manager.logger.info("OpenFortiVPN Manager version %s", self.app_version)
         self.logging_manager.logger.info("Using PyQt version: %s", QT_VERSION)
@@ -83,7 +108,47 @@ class MainWindow(QMainWindow):
                 browser.name,
                 profile_count,
             )
-        self._populate_table()
+        # ConfigManager has just read the file; skip a second parse.
+        self._populate_table(reload=False)
+
+    def _prefetch_selected_credentials(self) -> None:
+        row = self.table.currentRow()
+        item = self.table.item(row, 0) if row >= 0 else None
+        profile = self._find_profile(item.text()) if item else None
+        if not profile or profile.auth_type.lower() != "password":
+            return
+        if self._pending_credentials and self._pending_credentials[0] == profile.name:
+            return
+        if not self.keyring_manager.is_available():
+            return
+        future = self._keyring_pool.submit(self.keyring_manager.load_password, profile.name)
+        self._pending_credentials = (profile.name, future)
+
+    def _load_stored_credentials(self, name: str) -> Optional[Tuple[str, str]]:
+        pending, self._pending_credentials = self._pending_credentials, None
+        if pending and pending[0] == name:
+            # A read already in flight is waited out rather than repeated, but
+            # a stuck keyring backend must not freeze the UI indefinitely.
+            try:
+                return pending[1].result(timeout=2)
+            except FutureTimeoutError:
+                self.logging_manager.logger.warning(
+                    "Prefetched credentials for %s timed out; reading directly", name
+                )
+            except Exception as exc:
+                self.logging_manager.logger.warning(
+                    "Prefetching credentials for %s failed: %s", name, exc
+                )
+        return self.keyring_manager.load_password(name)
+
+    def _delete_stored_password(self, name: str) -> bool:
+        if self._pending_credentials and self._pending_credentials[0] == name:
+            self._pending_credentials = None
+        return self.keyring_manager.delete_password(name)
+
+    @functools.cached_property
+    def browser_catalog(self) -> Dict[str, BrowserInfo]:
+        return {browser.key: browser for browser in self.browsers}
 
     def _build_ui(self) -> None:
         toolbar = QToolBar()
@@ -133,8 +198,8 @@ class MainWindow(QMainWindow):
         )
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(8, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(9, QHeaderView.ResizeMode.ResizeToContents)
+        for column in _CONTENT_SIZED_COLUMNS:
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
         self.table.verticalHeader().setVisible(False)
         self.table.verticalHeader().setDefaultSectionSize(48)
         self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
@@ -142,6 +207,7 @@ class MainWindow(QMainWindow):
         self.table.setAlternatingRowColors(True)
         self.table.setShowGrid(False)
         self.table.setWordWrap(False)
+        self.table.itemSelectionChanged.connect(self._prefetch_selected_credentials)
         splitter.addWidget(self.table)
 
         self.log_viewer = QPlainTextEdit()
@@ -156,37 +222,91 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(central)
 
     def _append_log(self, message: str) -> None:
-        self.log_viewer.appendPlainText(message)
-        self.log_viewer.verticalScrollBar().setValue(self.log_viewer.verticalScrollBar().maximum())
+        self._pending_logs.append(message)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_logs(self) -> None:
+        if not self._pending_logs:
+            return
+        messages, self._pending_logs = self._pending_logs, []
+        self.log_viewer.appendPlainText("\n".join(messages))
+        self.log_viewer.moveCursor(QTextCursor.MoveOperation.End)
 
-    def _populate_table(self) -> None:
-        self.config_manager.reload()
+    def _populate_table(self, *, reload: bool = True) -> None:
+        if reload:
+            self.config_manager.reload()
         profiles = self.config_manager.profiles()
-        self.table.setRowCount(0)
-        self.profile_rows.clear()
-        for profile in profiles:
-            self._add_profile_row(profile)
-
-    def _add_profile_row(self, profile: VPNProfile) -> None:
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.profile_rows[profile.name] = row
-        self.table.setItem(row, 0, QTableWidgetItem(profile.name))
-        self.table.setItem(row, 1, QTableWidgetItem(profile.host))
-        self.table.setItem(row, 2, QTableWidgetItem(str(profile.port)))
-        self.table.setItem(row, 3, QTableWidgetItem(profile.auth_type.capitalize()))
-        self.table.setItem(row, 4, QTableWidgetItem(self._browser_display(profile.browser)))
-        self.table.setItem(row, 5, QTableWidgetItem(profile.browser_profile or ""))
-        self.table.setItem(row, 6, QTableWidgetItem(profile.username or ""))
-        self.table.setItem(row, 7, QTableWidgetItem("Yes" if profile.auto_reconnect else "No"))
-        status_text = self.session_status.get(profile.name, "Idle")
-        status_item = QTableWidgetItem(status_text)
-        if hasattr(Qt, "AlignmentFlag"):
-            alignment_value = int(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-        else:
-            alignment_value = int(Qt.AlignVCenter | Qt.AlignLeft)
-        status_item.setTextAlignment(alignment_value)
-        self.table.setItem(row, 8, status_item)
+        self._profile_by_name = {profile.name: profile for profile in profiles}
+        # Size the table once and hold repaints and model signals until every
+        # row is filled, so Qt lays out the table a single time.
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        # Content-sized columns would be measured again for every cell filled
+        # below; hold them fixed and let Qt measure once when restored.
+        header = self.table.horizontalHeader()
+        for column in _CONTENT_SIZED_COLUMNS:
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+        try:
+            self.table.setRowCount(len(profiles))
+            self.profile_rows.clear()
+            previous = self._row_values
+            self._row_values = []
+            for row, profile in enumerate(profiles):
+                values = self._profile_row_values(profile)
+                self._row_values.append(values)
+                self.profile_rows[profile.name] = row
+                if row < len(previous) and previous[row] == values:
+                    continue
+                self._add_profile_row(row, profile, values)
+        finally:
+            for column in _CONTENT_SIZED_COLUMNS:
+                header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+        self.table.viewport().update()
+
+    def _profile_row_values(self, profile: VPNProfile) -> Tuple[object, ...]:
+        """Return the text of columns 0-8 followed by the routes-button state."""
+        return (
+            profile.name,
+            profile.host,
+            str(profile.port),
+            profile.auth_type.capitalize(),
+            self._browser_display(profile.browser),
+            profile.browser_profile or "",
+            profile.username or "",
+            "Yes" if profile.auto_reconnect else "No",
+            self.session_status.get(profile.name, "Idle"),
+            bool(profile.routes),
+        )
+
+    def _add_profile_row(self, row: int, profile: VPNProfile, values: Tuple[object, ...]) -> None:
+        *texts, has_routes = values
+        # Rows left over from the previous populate keep their items and
+        # action widget; only cells whose text changed are touched.
+        for column, text in enumerate(texts):
+            item = self.table.item(row, column)
+            if item is None:
+                item = QTableWidgetItem(text)
+                if column == 8:
+                    if hasattr(Qt, "AlignmentFlag"):
+                        alignment_value = int(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
+                    else:
+                        alignment_value = int(Qt.AlignVCenter | Qt.AlignLeft)
+                    item.setTextAlignment(alignment_value)
+                self.table.setItem(row, column, item)
+            elif item.text() != text:
+                item.setText(text)
+        widget = self.table.cellWidget(row, 9)
+        if widget is None:
+            widget = self._build_row_actions()
+            self.table.setCellWidget(row, 9, widget)
+        for button in widget.findChildren(QPushButton):
+            button.setProperty("profile", profile.name)
+        widget.findChild(QPushButton, "routesButton").setEnabled(has_routes)
+
+    def _build_row_actions(self) -> QWidget:
         widget = QWidget()
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -196,36 +316,59 @@ class MainWindow(QMainWindow):
         connect_button.setObjectName("connectButton")
         connect_button.setMinimumWidth(96)
         connect_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        connect_button.clicked.connect(lambda checked=False, name=profile.name: self._connect_profile(name))
+        connect_button.clicked.connect(self._on_connect_clicked)
         disconnect_button = QPushButton("Disconnect")
         disconnect_button.setObjectName("disconnectButton")
         disconnect_button.setMinimumWidth(96)
         disconnect_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        disconnect_button.clicked.connect(lambda checked=False, name=profile.name: self._disconnect_profile(name))
+        disconnect_button.clicked.connect(self._on_disconnect_clicked)
         routes_button = QPushButton("Apply Routes")
         routes_button.setObjectName("routesButton")
         routes_button.setMinimumWidth(120)
         routes_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        routes_button.setEnabled(bool(profile.routes))
-        routes_button.clicked.connect(
-            lambda checked=False, name=profile.name: self._apply_routes(name)
-        )
+        routes_button.clicked.connect(self._on_routes_clicked)
         layout.addWidget(connect_button)
         layout.addWidget(disconnect_button)
         layout.addWidget(routes_button)
         layout.addStretch()
         widget.setLayout(layout)
-        self.table.setCellWidget(row, 9, widget)
+        return widget
+
+    # Row buttons share these slots and carry their profile name as a Qt
+    # property, instead of each holding its own lambda closure.
+    def _sender_profile(self) -> Optional[str]:
+        sender = self.sender()
+        return sender.property("profile") if sender else None
+
+    def _on_connect_clicked(self) -> None:
+        name = self._sender_profile()
+        if name:
+            self._connect_profile(name)
+
+    def _on_disconnect_clicked(self) -> None:
+        name = self._sender_profile()
+        if name:
+            self._disconnect_profile(name)
+
+    def _on_routes_clicked(self) -> None:
+        name = self._sender_profile()
+        if name:
+            self._apply_routes(name)
 
     def _browser_display(self, key: str) -> str:
         info = self.browser_catalog.get(key)
         return info.name if info else key
 
     def _find_profile(self, name: str) -> Optional[VPNProfile]:
-        return self.config_manager.get(name)
+        return self._profile_by_name.get(name)
 
     def _add_profile(self) -> None:
-        dialog = ProfileDialog(self.browsers, parent=self)
+        # Dialogs are imported on first use; most launches never open one.
+        from gui.dialogs import ProfileDialog
+
+        dialog = ProfileDialog.obtain(
+            self.browsers, parent=self, browsers_by_key=self.browser_catalog
+        )
         profile = dialog.get_profile()
         if not profile:
             return
@@ -241,13 +384,17 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Select", "Select a profile to edit.")
             return
         name = self.table.item(row, 0).text()
-        profile = self.config_manager.get(name)
+        profile = self._find_profile(name)
         if not profile:
             return
         if name in self.sessions:
             QMessageBox.warning(self, "Active", "Disconnect the VPN before editing this profile.")
             return
-        dialog = ProfileDialog(self.browsers, profile=profile, parent=self)
+        from gui.dialogs import ProfileDialog
+
+        dialog = ProfileDialog.obtain(
+            self.browsers, profile=profile, parent=self, browsers_by_key=self.browser_catalog
+        )
         updated = dialog.get_profile()
         if not updated:
             return
@@ -256,7 +403,7 @@ class MainWindow(QMainWindow):
             return
         if updated.name != name:
             self.config_manager.remove(name)
-            self.keyring_manager.delete_password(name)
+            self._delete_stored_password(name)
             self.session_status.pop(name, None)
             self.sessions.pop(name, None)
         self.config_manager.upsert(updated)
@@ -273,7 +420,7 @@ class MainWindow(QMainWindow):
         if name in self.sessions:
             self._disconnect_profile(name)
         self.config_manager.remove(name)
-        self.keyring_manager.delete_password(name)
+        self._delete_stored_password(name)
         self.session_status.pop(name, None)
         self._populate_table()
 
@@ -283,7 +430,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Select", "Select a profile.")
             return
         name = self.table.item(row, 0).text()
-        if self.keyring_manager.delete_password(name):
+        if self._delete_stored_password(name):
             QMessageBox.information(self, "Keyring", "Password removed from keyring.")
         else:
             QMessageBox.warning(self, "Keyring", "No stored password or keyring unavailable.")
@@ -292,19 +439,21 @@ class MainWindow(QMainWindow):
         if name in self.sessions:
             QMessageBox.information(self, "Active", "Connection already active.")
             return
-        profile = self.config_manager.get(name)
+        profile = self._find_profile(name)
         if not profile:
             QMessageBox.warning(self, "Missing", "Profile not found.")
             return
         credentials = None
         if profile.auth_type.lower() == "password":
-            stored = self.keyring_manager.load_password(profile.name)
+            stored = self._load_stored_credentials(profile.name)
             if stored:
                 credentials = stored
                 profile.username = stored[0]
                 self.config_manager.upsert(profile)
                 self._update_table_username(profile.name, profile.username)
             else:
+                from gui.dialogs import CredentialDialog
+
                 dialog = CredentialDialog(profile.username or "", self)
                 result = dialog.get_credentials()
                 if not result:
@@ -324,10 +473,11 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Privilege", str(exc))
                 return
         session = VPNSession(profile, self.privilege_manager, self.route_manager, self.browser_catalog, credentials)
-        session.status_changed.connect(lambda status, profile=name: self._update_status(profile, status))
-        session.log_line.connect(lambda message, profile=name: self._log_session_output(profile, message))
-        session.connected.connect(lambda profile_name: self._on_connected(profile_name))
-        session.disconnected.connect(lambda profile_name: self._on_disconnected(profile_name))
+        session.status_changed.connect(self._update_status)
+        session.log_line.connect(self._log_session_output)
+        session.log_lines.connect(self._log_session_lines)
+        session.connected.connect(self._on_connected)
+        session.disconnected.connect(self._on_disconnected)
         self.sessions[name] = session
         session.start()
         self._update_status(name, "Connecting")
@@ -346,6 +496,7 @@ class MainWindow(QMainWindow):
                     self.privilege_manager,
                     True,
                     session.command_signature(),
+                    scan_orphans=True,
                 )
                 if not session.wait(5000):
                     self.logging_manager.logger.error(
@@ -358,7 +509,7 @@ class MainWindow(QMainWindow):
                 self.privilege_manager.clear_cached_password()
 
     def _apply_routes(self, name: str) -> None:
-        profile = self.config_manager.get(name)
+        profile = self._find_profile(name)
         if not profile:
             QMessageBox.warning(self, "Missing", "Profile not found.")
             return
@@ -378,6 +529,11 @@ class MainWindow(QMainWindow):
     def _log_session_output(self, profile: str, message: str) -> None:
         self.logging_manager.logger.info("[%s] %s", profile, message)
 
+    def _log_session_lines(self, profile: str, messages: list[str]) -> None:
+        logger = self.logging_manager.logger
+        for message in messages:
+            logger.info("[%s] %s", profile, message)
+
     def _on_connected(self, name: str) -> None:
         self._update_status(name, "Connected")
 
@@ -391,38 +547,26 @@ class MainWindow(QMainWindow):
 
     def _update_status(self, name: str, status: str) -> None:
         self.session_status[name] = status
-        row = self.profile_rows.get(name)
-        if row is not None and row < self.table.rowCount():
-            status_item = self.table.item(row, 8)
-            if status_item:
-                status_item.setText(status)
-            return
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.text() == name:
-                status_item = self.table.item(row, 8)
-                if status_item:
-                    status_item.setText(status)
-                self.profile_rows[name] = row
-                break
+        self._set_cell_text(name, 8, status)
 
     def _update_table_username(self, name: str, username: str) -> None:
+        self._set_cell_text(name, 6, username)
+
+    def _set_cell_text(self, name: str, column: int, text: str) -> None:
+        # profile_rows is rebuilt with the table, so a miss means the profile
+        # has no row (e.g. removed while its session was shutting down).
         row = self.profile_rows.get(name)
-        if row is not None and row < self.table.rowCount():
-            username_item = self.table.item(row, 6)
-            if username_item:
-                username_item.setText(username)
+        item = self.table.item(row, column) if row is not None else None
+        if item is None:
+            self.logging_manager.logger.debug("[%s] No table row to update", name)
             return
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.text() == name:
-                username_item = self.table.item(row, 6)
-                if username_item:
-                    username_item.setText(username)
-                self.profile_rows[name] = row
-                break
+        # Sessions repeat statuses; an unchanged cell needs no dataChanged.
+        if item.text() != text:
+            item.setData(Qt.ItemDataRole.DisplayRole, text)
 
     def _request_sudo_password(self):
+        from gui.dialogs import SudoPasswordDialog
+
         dialog = SudoPasswordDialog(self)
         result = dialog.get_password()
         return result
@@ -441,12 +585,15 @@ class MainWindow(QMainWindow):
                     self.privilege_manager,
                     True,
                     session.command_signature(),
+                    scan_orphans=True,
                 )
                 session.wait(5000)
         self.sessions.clear()
         VPNSession.terminate_orphaned_processes(self.privilege_manager)
         VPNSession.cleanup_all_profiles(self.config_manager.profiles(), self.privilege_manager)
         self.logging_manager.remove_listener(self._log_listener)
+        self._pending_credentials = None
+        self._keyring_pool.shutdown(wait=False, cancel_futures=True)
         if not self.privilege_manager.cache_allowed():
             self.privilege_manager.clear_cached_password()
         super().closeEvent(event)
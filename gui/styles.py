@@ -1,5 +1,19 @@
 """Centralized stylesheet definitions for the GUI."""
 
+import re
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_RE = re.compile(r"\s*([{};:,])\s*")
+
+
+def _minify_qss(qss: str) -> str:
+    """Strip comments and redundant whitespace so Qt parses fewer tokens."""
+    qss = _COMMENT_RE.sub("", qss)
+    qss = _WHITESPACE_RE.sub(" ", qss)
+    return _PUNCTUATION_RE.sub(r"\1", qss).strip()
+
+
 DARK_THEME_QSS = """
 * {
     font-family: "Noto Sans", "Segoe UI", sans-serif;
@@ -194,3 +208,5 @@ QSplitter::handle {
     margin: 6px 0;
 }
 """
+
+DARK_THEME_QSS = _minify_qss(DARK_THEME_QSS)
@@ -77,3 +77,23 @@ def test_remove_saves_without_deadlock(config_manager):
 
     assert not thread.is_alive(), "remove should complete without hanging"
     assert config_manager.get("remove-me") is None
+
+
+def test_save_keeps_file_mode_and_cleans_up_staging(config_manager, monkeypatch):
+    """save() should preserve the config file's mode and never leave a .tmp behind."""
+
+    manager_module = sys.modules["config.manager"]
+    config_file = Path(manager_module.CONFIG_FILE)
+    config_manager.save()
+    config_file.chmod(0o640)
+
+    config_manager.upsert(VPNProfile(name="mode", host="vpn.example.com", port=443, auth_type="password"))
+    assert config_file.stat().st_mode & 0o777 == 0o640
+
+    def fail_replace(*_args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manager_module.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        config_manager.save()
+    assert not config_file.with_name(config_file.name + ".tmp").exists()
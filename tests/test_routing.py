@@ -307,3 +307,36 @@ def test_cleanup_handles_failed_delete(route_manager, monkeypatch):
         ["ip", "route", "flush", "cache"],
     ]
     assert "missing" not in route_manager._session_routes
+
+
+def test_apply_routes_reuses_lookups_across_reconnects(route_manager, monkeypatch):
+    """Host name targets should be resolved once per session and tunnel interface."""
+
+    lookups: List[str] = []
+
+    def fake_getaddrinfo(host, port):
+        lookups.append(host)
+        return [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("203.0.113.7", 0)),
+            (socket.AF_INET, socket.SOCK_DGRAM, 17, "", ("203.0.113.7", 0)),
+        ]
+
+    commands: List[List[str]] = []
+
+    def fake_run(command: List[str]):
+        commands.append(command)
+        return 0, "", ""
+
+    monkeypatch.setattr("core.routing.socket.getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(route_manager, "_run_privileged", fake_run)
+
+    route_manager.apply_routes("vpn", ["intranet.example.com"], "ppp0")
+    route_manager.cleanup("vpn")
+    route_manager.apply_routes("vpn", ["intranet.example.com"], "ppp0")
+
+    assert lookups == ["intranet.example.com"]
+    assert sum("203.0.113.7/32" in command for command in commands) >= 2
+
+    route_manager.apply_routes("other", ["intranet.example.com"], "ppp0")
+
+    assert len(lookups) == 2
@@ -1,5 +1,9 @@
 import importlib
+import os
 import signal
+import subprocess
+import sys
+import time
 
 import pytest
 
@@ -16,7 +20,7 @@ if not qt_available:
     pytest.skip("Qt bindings not installed", allow_module_level=True)
 
 from core.vpn_profile import VPNProfile
-from core.vpn_session import VPNSession
+from core.vpn_session import _PENDING_PROMPT_RE, VPNSession, _scan_output_events
 
 
 class DummyRouteManager:
@@ -90,3 +94,124 @@ def test_stop_uses_privileged_group(monkeypatch):
     assert privilege.calls == [(4321, signal.SIGTERM)]
     assert routes.cleaned == ["test"]
     assert process._running is False
+
+
+def test_wait_for_exit_returns_immediately_for_reaped_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+
+    started = time.monotonic()
+    assert VPNSession._wait_for_exit(process.pid, 5) is True
+    assert time.monotonic() - started < 1
+
+
+def test_terminate_many_waits_on_processes_concurrently():
+    processes = [subprocess.Popen(["sleep", "30"]) for _ in range(3)]
+    try:
+        started = time.monotonic()
+        VPNSession._terminate_many(
+            [(process.pid, None, "batch") for process in processes],
+            DummyPrivilegeManager(),
+        )
+        assert time.monotonic() - started < 5
+        for process in processes:
+            assert process.wait(timeout=1) == -signal.SIGTERM
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+
+def test_terminate_entry_reaps_owned_child():
+    process = subprocess.Popen(["sleep", "30"])
+    try:
+        VPNSession._terminate_entry(
+            process.pid, None, DummyPrivilegeManager(), "owned", process=process
+        )
+        assert process.returncode == -signal.SIGTERM
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+
+def test_find_signature_matches_detects_untracked_openfortivpn(tmp_path):
+    fake_binary = tmp_path / "openfortivpn"
+    fake_binary.write_text("#!/bin/sh\nsleep 30\n")
+    fake_binary.chmod(0o755)
+    profile = VPNProfile(name="scan", host="vpn.example.com", port=10443, auth_type="password")
+    process = subprocess.Popen([str(fake_binary), "vpn.example.com:10443"], start_new_session=True)
+    try:
+        time.sleep(0.1)
+        process_comm = open(f"/proc/{process.pid}/comm").read().strip()
+        if process_comm != "openfortivpn":
+            pytest.skip("kernel reports a different comm for script processes")
+        matches = VPNSession._find_signature_matches(profile)
+        assert (process.pid, process.pid, "scan") in matches
+    finally:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+
+def test_build_host_tokens_reflects_profile_edits():
+    profile = VPNProfile(name="tokens", host="vpn.example.com", port=443, auth_type="saml", saml_port=8020)
+
+    tokens = VPNSession._build_host_tokens(
+        profile, [("openfortivpn", "vpn.example.com:443", "--saml-login=8020")]
+    )
+    assert {"vpn.example.com", "vpn.example.com:443"} <= tokens
+    assert tokens.isdisjoint({"openfortivpn", "443", "--saml-login", "8020"})
+
+    profile.port = 10443
+    assert "vpn.example.com:10443" in VPNSession._build_host_tokens(profile)
+
+
+def test_find_signature_matches_ignores_other_profiles_on_same_port(monkeypatch):
+    office = VPNProfile(name="office", host="office.example.com", port=443, auth_type="password")
+    lab = VPNProfile(name="lab", host="lab.example.com", port=443, auth_type="password")
+    monkeypatch.setattr(
+        VPNSession,
+        "_untracked_openfortivpn_processes",
+        classmethod(lambda cls: iter([(4242, ["openfortivpn", "lab.example.com:443"])])),
+    )
+    monkeypatch.setattr(VPNSession, "_process_group_of", staticmethod(lambda pid: pid))
+
+    office_signature = [("openfortivpn", "office.example.com:443")]
+    assert VPNSession._find_signature_matches(office, office_signature) == []
+    assert VPNSession._find_signature_matches(lab) == [(4242, 4242, "lab")]
+
+
+def test_cleanup_skips_process_scan_only_without_signature(monkeypatch):
+    profile = VPNProfile(name="reaped", host="vpn.example.com", port=443, auth_type="password")
+    scans = []
+    monkeypatch.setattr(
+        VPNSession, "_find_signature_matches", classmethod(lambda cls, *args: scans.append(args) or [])
+    )
+
+    VPNSession.cleanup_profile_processes(profile, DummyPrivilegeManager())
+    assert scans == []
+
+    VPNSession.cleanup_profile_processes(profile, DummyPrivilegeManager(), signature=("openfortivpn",))
+    assert len(scans) == 1
+
+    VPNSession.cleanup_profile_processes(
+        profile, DummyPrivilegeManager(), signature_tokens=frozenset({"vpn.example.com"})
+    )
+    assert len(scans) == 2
+
+    VPNSession.cleanup_profile_processes(profile, DummyPrivilegeManager(), scan_orphans=True)
+    assert len(scans) == 3
+
+
+def test_scan_output_events_reports_every_event_on_a_line():
+    events = _scan_output_events("Close the browser window; Tunnel is up on ppp0")
+
+    assert events.saml_prompt is True
+    assert events.tunnel_up is True
+
+
+def test_pending_prompt_matches_only_openfortivpn_password_prompt():
+    assert _PENDING_PROMPT_RE.search(b"VPN account password: ")
+    assert not _PENDING_PROMPT_RE.search(b"[sudo] password for alice: ")
+    assert not _PENDING_PROMPT_RE.search(b"Password: ")